@@ -2,20 +2,24 @@
 MultiQC modules base class, contains helper functions
 """
 
+import bisect
 import dataclasses
 import fnmatch
+import functools
 import io
 import itertools
 import logging
-import mimetypes
+import math
 import os
 import re
+import sys
 import textwrap
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Union
 
-import markdown
+import numpy as np
 import packaging.version
 
 from multiqc import config, report
@@ -35,12 +39,180 @@ from multiqc.types import AnchorT, ModuleIdT, SectionIdT
 
 logger = logging.getLogger(__name__)
 
+# Extensions that the custom content module can handle as images. Cheaper to check than
+# calling mimetypes.guess_type for every matched file, when almost all of them are text logs
+_IMAGE_EXTS = frozenset({".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp", ".bmp", ".tif", ".tiff"})
+
+# Value types allowed in general stats cells. An exact-class lookup in this set is much
+# cheaper than an isinstance() check, which walks the MRO for every cell; isinstance is
+# kept as a fallback so subclasses (e.g. numpy floats) are still accepted
+_SCALAR_CELL_TYPES = frozenset({int, float, str, bool, type(None)})
+
+
+@functools.lru_cache(maxsize=1024)
+def _render_markdown(text: str) -> str:
+    """
+    Render markdown to HTML. Blank input skips the engine entirely, and results are
+    cached since section descriptions repeat across module instances. The import is
+    deferred so the markdown machinery is only set up when something needs rendering.
+    """
+    if not text.strip():
+        return ""
+    import markdown
+
+    return markdown.markdown(text)
+
+
+def _as_float(val: Any) -> float:
+    """Coerce a metric value to float, using NaN for non-numeric values."""
+    return float(val) if isinstance(val, (int, float)) else math.nan
+
+
+@functools.lru_cache(maxsize=32)
+def _fuse_ignore_globs(globs: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """Fuse sample ignore globs into one compiled alternation (None if empty)."""
+    if not globs:
+        return None
+    return re.compile("|".join(f"(?:{fnmatch.translate(os.path.normcase(g))})" for g in globs))
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_ignore_regexes(patterns: Tuple[str, ...]) -> Tuple[re.Pattern, ...]:
+    """
+    Compile sample ignore regexes individually. Unlike the globs above they cannot be
+    fused into one alternation: user patterns may carry global inline flags like (?i),
+    which only compile at the start of an expression, or backreferences, whose group
+    numbers would be shifted by preceding alternatives.
+    """
+    return tuple(re.compile(p) for p in patterns)
+
+
+# Cleaning rules resolved from fn_clean_exts lists, keyed by list id. The cached entry
+# holds a shallow-copy snapshot of the list, validated by value on each lookup: the
+# config layer extends the list in place (e.g. extra_fn_clean_exts between interactive
+# runs), so an identity check would keep serving stale compiled rules. Comparing a
+# handful of small entries is still far cheaper than re-interpreting them per sample
+_CLEAN_RULES_CACHE: Dict[int, Tuple[List[CleanPatternT], List[Tuple[str, Any, Optional[FrozenSet[str]]]]]] = {}
+
+
+def _get_clean_rules(fn_clean_exts: List[CleanPatternT]) -> List[Tuple[str, Any, Optional[FrozenSet[str]]]]:
+    """
+    Resolve each fn_clean_exts entry into a (type, pattern, module filter) tuple, with
+    regex patterns precompiled. Invalid entries are reported once and dropped.
+    """
+    cached = _CLEAN_RULES_CACHE.get(id(fn_clean_exts))
+    if cached is not None and cached[0] == fn_clean_exts:
+        return cached[1]
+
+    rules: List[Tuple[str, Any, Optional[FrozenSet[str]]]] = []
+    _ext: CleanPatternT
+    for _ext in fn_clean_exts:
+        if isinstance(_ext, str):
+            _ext = {"type": "truncate", "pattern": _ext}
+
+        ext_type = _ext.get("type")
+        pattern = _ext.get("pattern", "")
+        assert isinstance(pattern, str)
+
+        # Check if this config is limited to a module
+        module_filter: Optional[FrozenSet[str]] = None
+        if "module" in _ext:
+            modules = _ext["module"]
+            module_filter = frozenset((modules,)) if isinstance(modules, str) else frozenset(modules)
+
+        if ext_type == "replace":
+            logger.warning(
+                "use 'config.fn_clean_sample_names.remove' instead "
+                "of 'config.fn_clean_sample_names.replace' [deprecated]"
+            )
+        if ext_type in ("regex", "regex_keep"):
+            rules.append((ext_type, re.compile(pattern), module_filter))
+        elif ext_type in ("truncate", "remove", "replace"):
+            rules.append((ext_type, pattern, module_filter))
+        elif ext_type is None:
+            logger.error(f'config.fn_clean_exts config was missing "type" key: {_ext}')
+        else:
+            logger.error(f"Unrecognised sample name cleaning pattern: {ext_type}")
+
+    # Fuse runs of adjacent single-character "remove" rules into one translation table,
+    # so they apply in a single str.translate() pass instead of chained replaces
+    fused: List[Tuple[str, Any, Optional[FrozenSet[str]]]] = []
+    for rule in rules:
+        ext_type, pattern, module_filter = rule
+        if ext_type in ("remove", "replace") and len(pattern) == 1:
+            if fused and fused[-1][0] == "translate" and fused[-1][2] == module_filter:
+                fused[-1][1][ord(pattern)] = None
+            else:
+                fused.append(("translate", {ord(pattern): None}, module_filter))
+        else:
+            fused.append(rule)
+    rules = fused
+
+    if len(_CLEAN_RULES_CACHE) > 128:  # only ever expected to hold a handful of lists
+        _CLEAN_RULES_CACHE.clear()
+    _CLEAN_RULES_CACHE[id(fn_clean_exts)] = (list(fn_clean_exts), rules)
+    return rules
+
+
+# Replacement rules resolved from sample_names_replace, cached with a value-validated
+# snapshot in the same way as the cleaning rules cache above: config.update() merges
+# dicts in place, so the dict keeps its identity when extended
+_REPLACE_RULES_CACHE: Dict[int, Tuple[Dict[str, str], bool, List[Tuple[str, str, Optional[re.Pattern]]]]] = {}
+
+
+def _get_replace_rules(
+    sample_names_replace: Dict[str, str], use_regex: bool
+) -> List[Tuple[str, str, Optional[re.Pattern]]]:
+    """
+    Resolve the --replace-names rules into (search, replacement, compiled pattern)
+    tuples; the pattern is None when regex matching is off. Patterns that fail to
+    compile are reported once and dropped.
+    """
+    cached = _REPLACE_RULES_CACHE.get(id(sample_names_replace))
+    if cached is not None and cached[0] == sample_names_replace and cached[1] == use_regex:
+        return cached[2]
+
+    rules: List[Tuple[str, str, Optional[re.Pattern]]] = []
+    for s_name_search, s_name_replace in sample_names_replace.items():
+        pattern: Optional[re.Pattern] = None
+        if use_regex:
+            try:
+                pattern = re.compile(s_name_search)
+            except re.error as e:
+                logger.error(f"Error with sample name replacement regex: {e}")
+                continue
+        rules.append((s_name_search, s_name_replace, pattern))
+
+    if len(_REPLACE_RULES_CACHE) > 128:  # only ever expected to hold a handful of dicts
+        _REPLACE_RULES_CACHE.clear()
+    _REPLACE_RULES_CACHE[id(sample_names_replace)] = (dict(sample_names_replace), use_regex, rules)
+    return rules
+
+
+def _trim_read_suffix(name: str, read_number: str) -> str:
+    """
+    Trim a trailing read-number suffix like "_1", ".1" or "-r1" (i.e. "[_.-][rR]?<read_number>$").
+    Returns the name unchanged if there is no such suffix.
+    """
+    if name.endswith(read_number):
+        trimmed = name[:-1]
+        if trimmed and trimmed[-1] in "rR":
+            trimmed = trimmed[:-1]
+        if trimmed and trimmed[-1] in "_.-":
+            return trimmed[:-1]
+    return name
+
 
 class ModuleNoSamplesFound(Exception):
     """Module checked all input files but couldn't find any data to use"""
 
 
-@dataclasses.dataclass
+# Slotted dataclasses skip the per-instance __dict__, which adds up for classes
+# created once per sample or section. Only available from Python 3.10
+_dataclass_kwargs = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclasses.dataclass(**_dataclass_kwargs)
 class SampleNameMeta:
     original_name: SampleNameT
     trimmed_name: Optional[SampleNameT] = None
@@ -49,7 +221,7 @@ class SampleNameMeta:
     labels: List[str] = dataclasses.field(default_factory=list)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(**_dataclass_kwargs)
 class Section:
     name: str
     anchor: AnchorT
@@ -68,7 +240,7 @@ class Section:
 ExtraFunctionType = Callable[[InputRowT, List[Tuple[Optional[str], SampleNameT, SampleNameT]]], None]
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(**_dataclass_kwargs)
 class SampleGroupingConfig:
     cols_to_weighted_average: Optional[List[Tuple[ColumnKeyT, ColumnKeyT]]] = None
     cols_to_average: Optional[List[ColumnKeyT]] = None
@@ -80,6 +252,8 @@ class BaseMultiqcModule:
     # Custom options from user config that can overwrite base module values
     mod_cust_config: Dict = {}
     mod_id: Optional[ModuleIdT] = None
+    # Set once per module class in __init__, used by clean_child_attributes()
+    _base_attributes: FrozenSet[str]
 
     def __init__(
         self,
@@ -108,6 +282,10 @@ class BaseMultiqcModule:
 
         # List of software version(s) for module. Don't append directly, use add_software_version()
         self.versions: Dict[str, List[Tuple[Optional[packaging.version.Version], str]]] = defaultdict(list)
+        # Sort keys parallel to self.versions, so each registration is a bisect insert
+        # rather than a full re-sort, plus a set of seen entries for O(1) dedup
+        self._version_sort_keys: Dict[str, List[Tuple]] = defaultdict(list)
+        self._versions_seen: Dict[str, Set[Tuple[Optional[packaging.version.Version], str]]] = defaultdict(set)
 
         # Specific module level config to overwrite (e.g. config.bcftools, config.fastqc)
         config.update({self.id: self.mod_cust_config.get("custom_config", {})})
@@ -144,7 +322,7 @@ class BaseMultiqcModule:
             if self.comment is not None:
                 self.comment = textwrap.dedent(self.comment)
                 if autoformat_type == "markdown":
-                    self.comment = markdown.markdown(self.comment)
+                    self.comment = _render_markdown(self.comment)
 
         self.sections: List[Section] = []
 
@@ -155,11 +333,36 @@ class BaseMultiqcModule:
         self.css: Dict[str, str] = dict()
         self.js: Dict[str, str] = dict()
 
-        # Get list of all base attributes, so we clean up any added by child modules
-        self._base_attributes = [k for k in dir(self)]
+        # Get the set of all base attributes, so we clean up any added by child modules.
+        # dir() gives the same result for every instance of a class at this point of
+        # __init__, so it's computed once per module class
+        cls = self.__class__
+        if "_base_attributes" not in cls.__dict__:
+            cls._base_attributes = frozenset(dir(self))
 
         self.sample_names: List[SampleNameMeta] = []
 
+        # Cache for groups_for_sample(): cleaning the same sample name against the merge-groups
+        # patterns is repeated for every general stats section, and the result is stable per run
+        self._groups_cache: Dict[SampleNameT, Tuple[SampleGroupT, Optional[str]]] = {}
+        self._groups_cache_cfg: Optional[Dict] = None
+        # The merge-groups patterns, normalized into lists once per config
+        self._merge_group_exts: List[Tuple[str, List[CleanPatternT]]] = []
+
+        # Cache for clean_s_name(): aggregator modules like RSeQC pass the same file
+        # names through every submodule, repeating identical cleaning work
+        self._clean_names_cache: Dict[Tuple, str] = {}
+        self._clean_names_cache_cfg: Optional[Tuple] = None
+
+        # Directory components per root for prepend_dirs: the same root repeats for
+        # every file found in a directory, so it only needs parsing once
+        self._dirs_cache: Dict[str, Tuple[str, ...]] = {}
+
+        # Inner report.data_sources dicts per (module, section), so registering a data
+        # source is a single assignment instead of three nested defaultdict lookups
+        self._data_sources_cache: Dict[Tuple[str, str], Dict] = {}
+        self._data_sources_cache_root: Optional[Dict] = None
+
     def _get_intro(self):
         doi_html = ""
         if len(self.doi) > 0:
@@ -204,6 +407,41 @@ class BaseMultiqcModule:
         """
         return self.__saved_raw_data
 
+    @functools.cached_property
+    def _path_filters(self) -> Tuple[List[str], List[str]]:
+        """
+        Path filters ("path_filters" / "path_filters_exclude") from the user config,
+        with any leading "./" stripped. Allows modules to be called multiple times with
+        different sets of files. mod_cust_config doesn't change over the module's
+        lifetime, so this only needs computing once.
+        """
+
+        def get_path_filters(key: str) -> List[str]:
+            val = self.mod_cust_config.get(key, [])
+            values = val if isinstance(val, list) else [val]
+            return [pf[2:] if pf.startswith("./") else pf for pf in values]
+
+        return get_path_filters("path_filters"), get_path_filters("path_filters_exclude")
+
+    @staticmethod
+    def _compile_path_filters(path_filters: List[str]) -> Optional[re.Pattern]:
+        """
+        Fuse glob-style path filters into a single compiled regex via alternation, so all
+        patterns are checked with one scan per file. Each filter is tried both as given and
+        prefixed with each analysis dir, matching fnmatch.fnmatch semantics.
+        """
+        if not path_filters:
+            return None
+        return re.compile(
+            "|".join(
+                f"(?:{fnmatch.translate(os.path.normcase(pf))})"
+                for pf in itertools.chain(
+                    path_filters,
+                    (os.path.join(analysis_dir, pf) for analysis_dir in report.analysis_files for pf in path_filters),
+                )
+            )
+        )
+
     def find_log_files(self, sp_key: str, filecontents=True, filehandles=False):
         """
         Return matches log files of interest.
@@ -216,112 +454,111 @@ class BaseMultiqcModule:
                  As yield is used, the results can be iterated over without loading all files at once
         """
 
-        # Pick up path filters if specified.
-        # Allows modules to be called multiple times with different sets of files
-        def get_path_filters(key: str) -> List[str]:
-            pfs: List[str] = []
-            val = self.mod_cust_config.get(key, [])
-            values = val if isinstance(val, list) else [val]
-            pf: str
-            for pf in values:
-                if pf.startswith("./"):
-                    pf = pf[2:]
-                pfs.append(pf)
-            return pfs
-
-        path_filters: List[str] = get_path_filters("path_filters")
-        path_filters_exclude: List[str] = get_path_filters("path_filters_exclude")
+        path_filters, path_filters_exclude = self._path_filters
 
         if not isinstance(sp_key, str):
             logger.warning(f"The find_log_files() search key must be a string, got {type(sp_key)}: {sp_key}")
             return
 
+        # Compile the filters once per search (also with each analysis dir prepended, as both
+        # variants are tried), instead of calling fnmatch per pattern per file
+        path_filter_re = self._compile_path_filters(path_filters)
+        path_filter_exclude_re = self._compile_path_filters(path_filters_exclude)
+        have_path_filters = path_filter_re is not None or path_filter_exclude_re is not None
+
+        # Text files whose contents will be read in a thread pool if config.parallel_file_read is set
+        deferred_reads: List[Tuple[Dict, str]] = []
+
         for f in report.files.get(ModuleIdT(sp_key), []):
             # Make a note of the filename so that we can report it if something crashes
             last_found_file: str = os.path.join(f["root"], f["fn"])
             report.last_found_file = last_found_file
 
-            # Filter out files based on exclusion patterns
-            if path_filters_exclude and len(path_filters_exclude) > 0:
-                # Try both the given path and also the path prefixed with the analysis dirs
-                exclusion_hits = itertools.chain(
-                    (fnmatch.fnmatch(last_found_file, pfe) for pfe in path_filters_exclude),
-                    *(
-                        (
-                            fnmatch.fnmatch(last_found_file, os.path.join(analysis_dir, pfe))
-                            for pfe in path_filters_exclude
-                        )
-                        for analysis_dir in report.analysis_files
-                    ),
-                )
-                if any(exclusion_hits):
+            # Most module invocations configure no filters at all, so gate all the
+            # filtering work behind a single check
+            if have_path_filters:
+                norm_found_file = os.path.normcase(last_found_file)
+
+                # Filter out files based on exclusion patterns
+                if path_filter_exclude_re and path_filter_exclude_re.match(norm_found_file):
                     logger.debug(
                         f"{sp_key} - Skipping '{report.last_found_file}' as it matched the path_filters_exclude for '{self.name}'"
                     )
                     continue
 
-            # Filter out files based on inclusion patterns
-            if path_filters and len(path_filters) > 0:
-                # Try both the given path and also the path prefixed with the analyis dirs
-                inclusion_hits = itertools.chain(
-                    (fnmatch.fnmatch(last_found_file, pf) for pf in path_filters),
-                    *(
-                        (fnmatch.fnmatch(last_found_file, os.path.join(analysis_dir, pf)) for pf in path_filters)
-                        for analysis_dir in report.analysis_files
-                    ),
-                )
-                if not any(inclusion_hits):
-                    logger.debug(
-                        f"{sp_key} - Skipping '{report.last_found_file}' as it didn't match the path_filters for '{self.name}'"
-                    )
-                    continue
-                else:
-                    logger.debug(
-                        f"{sp_key} - Selecting '{report.last_found_file}' as it matched the path_filters for '{self.name}'"
-                    )
+                # Filter out files based on inclusion patterns
+                if path_filter_re:
+                    if not path_filter_re.match(norm_found_file):
+                        logger.debug(
+                            f"{sp_key} - Skipping '{report.last_found_file}' as it didn't match the path_filters for '{self.name}'"
+                        )
+                        continue
+                    else:
+                        logger.debug(
+                            f"{sp_key} - Selecting '{report.last_found_file}' as it matched the path_filters for '{self.name}'"
+                        )
 
             # Make a sample name from the filename
             f["sp_key"] = sp_key
             f["s_name"] = self.clean_s_name(f["fn"], f)
-            if filehandles or filecontents:
-                try:
-                    # Custom content module can now handle image files
-                    (ftype, encoding) = mimetypes.guess_type(os.path.join(f["root"], f["fn"]))
-                    fh: io.IOBase  # make mypy happy
-                    if ftype is not None and ftype.startswith("image"):
-                        with io.open(os.path.join(f["root"], f["fn"]), "rb") as fh:
-                            # always return file handles
-                            f["f"] = fh
-                            yield f
-                    else:
-                        # Everything else - should be all text files
-                        with io.open(os.path.join(f["root"], f["fn"]), "r", encoding="utf-8") as fh:
-                            if filehandles:
-                                f["f"] = fh
-                                yield f
-                            elif filecontents:
-                                try:
-                                    f["f"] = fh.read()
-                                except UnicodeDecodeError as e:
-                                    logger.debug(
-                                        f"Couldn't read file as utf-8: {f['fn']}, will attempt to skip non-unicode characters\n{e}"
-                                    )
-                                    try:
-                                        with io.open(
-                                            os.path.join(f["root"], f["fn"]), "r", encoding="utf-8", errors="ignore"
-                                        ) as fh_ignoring:
-                                            f["f"] = fh_ignoring.read()
-                                    except Exception as e:
-                                        logger.debug(f"Still couldn't read file: {f['fn']}\n{e}")
-                                        f["f"] = None
-                                    finally:
-                                        fh.close()
-                                yield f
-                except (IOError, OSError, ValueError, UnicodeDecodeError) as e:
-                    logger.debug(f"Couldn't open filehandle when returning file: {f['fn']}\n{e}")
-                    f["f"] = None
-            else:
+            if not filehandles and not filecontents:
                 yield f
+                continue
+
+            try:
+                fh: io.IOBase  # make mypy happy
+                # Custom content module can now handle image files
+                if os.path.splitext(f["fn"])[1].lower() in _IMAGE_EXTS:
+                    with io.open(last_found_file, "rb") as fh:
+                        # always return file handles
+                        f["f"] = fh
+                        yield f
+                elif filehandles:
+                    # Text files. Skipping non-unicode characters upfront, so a decode error
+                    # mid-read doesn't force the whole file to be read a second time
+                    with io.open(last_found_file, "r", encoding="utf-8", errors="ignore") as fh:
+                        f["f"] = fh
+                        yield f
+                elif config.parallel_file_read:
+                    deferred_reads.append((f, last_found_file))
+                else:
+                    read_f = self._read_contents(f, last_found_file)
+                    if read_f is not None:
+                        yield read_f
+            except (IOError, OSError, ValueError, UnicodeDecodeError) as e:
+                logger.debug(f"Couldn't open filehandle when returning file: {f['fn']}\n{e}")
+                f["f"] = None
+
+        # Blocking reads release the GIL, so overlapping them in a thread pool helps
+        # on high-latency storage. Results are yielded as they complete
+        if deferred_reads:
+            with ThreadPoolExecutor() as executor:
+                for future in as_completed(
+                    [executor.submit(self._read_contents, f, path) for f, path in deferred_reads]
+                ):
+                    read_f = future.result()
+                    if read_f is not None:
+                        yield read_f
+
+    @staticmethod
+    def _read_contents(f: Dict, path: str) -> Optional[Dict]:
+        """
+        Attach the full text contents of a matched file as f["f"].
+        Returns None if the file couldn't be read.
+        """
+        try:
+            # Reading whole contents: a single read + decode is cheaper than
+            # setting up the buffered text-IO layer for every small log file
+            contents = Path(path).read_bytes().decode("utf-8", errors="ignore")
+        except (IOError, OSError, ValueError) as e:
+            logger.debug(f"Couldn't read file when returning file contents: {f['fn']}\n{e}")
+            f["f"] = None
+            return None
+        if "\r" in contents:
+            # Match the universal-newline translation of text-mode reads
+            contents = contents.replace("\r\n", "\n").replace("\r", "\n")
+        f["f"] = contents
+        return f
 
     def add_section(
         self,
@@ -383,15 +620,15 @@ class BaseMultiqcModule:
             if len(description) > 0:
                 description = textwrap.dedent(description)
                 if autoformat_type == "markdown":
-                    description = markdown.markdown(description)
+                    description = _render_markdown(description)
             if len(comment) > 0:
                 comment = textwrap.dedent(comment)
                 if autoformat_type == "markdown":
-                    comment = markdown.markdown(comment)
+                    comment = _render_markdown(comment)
             if len(helptext) > 0:
                 helptext = textwrap.dedent(helptext)
                 if autoformat_type == "markdown":
-                    helptext = markdown.markdown(helptext)
+                    helptext = _render_markdown(helptext)
 
         # Strip excess whitespace
         description = description.strip()
@@ -427,23 +664,31 @@ class BaseMultiqcModule:
         """
         Try trimming r1 and r2 as paired FASTQ file names.
         """
-        # Try trimming the conventional illumina suffix with a tail 001 ending. Refs:
+        if r1 == r2:  # nothing to trim
+            return r1
+
+        # All the patterns below strip a read number, so if the names don't carry one,
+        # we can skip the trimming entirely
+        if "1" not in r1 and "2" not in r2:
+            return None
+
+        # Try trimming the conventional illumina suffix with a tail 001 ending ("_R1_\d{3}$"). Refs:
         # https://support.illumina.com/help/BaseSpace_Sequence_Hub_OLH_009008_2/Source/Informatics/BS/NamingConvention_FASTQ-files-swBS.htm
         # https://support.10xgenomics.com/spatial-gene-expression/software/pipelines/latest/using/fastq-input#:~:text=10x%20pipelines%20need%20files%20named,individual%20who%20demultiplexed%20your%20flowcell.
-        cleaned_r1 = re.sub(r"_R1_\d{3}$", "", r1)
-        cleaned_r2 = re.sub(r"_R2_\d{3}$", "", r2)
+        cleaned_r1 = r1[:-7] if r1[-7:-3] == "_R1_" and r1[-3:].isdigit() else r1
+        cleaned_r2 = r2[:-7] if r2[-7:-3] == "_R2_" and r2[-3:].isdigit() else r2
         if cleaned_r1 == cleaned_r2:  # trimmed successfully
             return cleaned_r1
 
         # Try removing _R1 and _R2 from the middle.
-        cleaned_r1 = re.sub(r"_R1_", "_", r1)
-        cleaned_r2 = re.sub(r"_R2_", "_", r2)
+        cleaned_r1 = r1.replace("_R1_", "_")
+        cleaned_r2 = r2.replace("_R2_", "_")
         if cleaned_r1 == cleaned_r2:  # trimmed successfully
             return cleaned_r1
 
         # Try trimming other variations from the end (-R1, _r1, _1, .1, etc).
-        cleaned_r1 = re.sub(r"([_.-][rR]?1)?$", "", r1)
-        cleaned_r2 = re.sub(r"([_.-][rR]?2)?$", "", r2)
+        cleaned_r1 = _trim_read_suffix(r1, "1")
+        cleaned_r2 = _trim_read_suffix(r2, "2")
         if cleaned_r1 == cleaned_r2:  # trimmed successfully
             return cleaned_r1
 
@@ -457,22 +702,35 @@ class BaseMultiqcModule:
         if not config.generalstats_sample_merge_groups:
             return SampleGroupT(s_name), None
 
+        # Invalidate the caches if the user config was swapped out under us
+        if self._groups_cache_cfg is not config.generalstats_sample_merge_groups:
+            self._groups_cache_cfg = config.generalstats_sample_merge_groups
+            self._groups_cache = {}
+            # Normalize the patterns once rather than for every (sample, label) pair
+            self._merge_group_exts = []
+            grouping_exts: List[CleanPatternT]
+            for label, grouping_exts in config.generalstats_sample_merge_groups.items():
+                if isinstance(grouping_exts, (str, dict)):
+                    grouping_exts = [grouping_exts]
+                if grouping_exts:
+                    self._merge_group_exts.append((label, grouping_exts))
+        cached = self._groups_cache.get(s_name)
+        if cached is not None:
+            return cached
+
         matched_label: Optional[str] = None
-        grouping_exts: List[CleanPatternT]
         group_name = SampleGroupT(s_name)
-        for label, grouping_exts in config.generalstats_sample_merge_groups.items():
-            if isinstance(grouping_exts, (str, dict)):
-                grouping_exts = [grouping_exts]
-            if grouping_exts:
-                s_name_without_ext = SampleNameT(
-                    self.clean_s_name(s_name, fn_clean_exts=grouping_exts, fn_clean_trim=[], prepend_dirs=False)
-                )
-                if s_name_without_ext != s_name:  # matched the label
-                    matched_label = label
-                    # Clean the rest of the name
-                    group_name = SampleGroupT(self.clean_s_name(s_name_without_ext))
-                    break
+        for label, grouping_exts in self._merge_group_exts:
+            s_name_without_ext = SampleNameT(
+                self.clean_s_name(s_name, fn_clean_exts=grouping_exts, fn_clean_trim=[], prepend_dirs=False)
+            )
+            if s_name_without_ext != s_name:  # matched the label
+                matched_label = label
+                # Clean the rest of the name
+                group_name = SampleGroupT(self.clean_s_name(s_name_without_ext))
+                break
 
+        self._groups_cache[s_name] = (group_name, matched_label)
         return group_name, matched_label
 
     def group_samples_names(
@@ -485,15 +743,12 @@ class BaseMultiqcModule:
         :return: a dict where the keys are group names, and the values are lists of tuples,
             of cleaned base names according to the cleaning rules and the original sample names
         """
-        group_by_label: Dict[Optional[str], List[Tuple[SampleGroupT, SampleNameT]]] = defaultdict(list)
-        for original_name in sorted(samples):
+        # A single pass: the input order is already deterministic, so no need to sort,
+        # or to build an intermediate per-label mapping
+        group_by_merged_name: Dict[SampleGroupT, List[Tuple[Optional[str], SampleNameT]]] = {}
+        for original_name in samples:
             group_name, label = self.groups_for_sample(original_name)
-            group_by_label[label].append((group_name, original_name))
-
-        group_by_merged_name: Dict[SampleGroupT, List[Tuple[Optional[str], SampleNameT]]] = defaultdict(list)
-        for label, group in group_by_label.items():
-            for group_name, original_name in group:
-                group_by_merged_name[group_name].append((label, original_name))
+            group_by_merged_name.setdefault(group_name, []).append((label, original_name))
 
         # Extend sample names in non-trivial groups with the group label
         return {
@@ -540,73 +795,42 @@ class BaseMultiqcModule:
 
             merged_row = InputRowT(sample=g_name, data={})
 
-            # Init a dictionary of all cols that would be summed to serve as weights
-            sum_by_col: Dict[ColumnKeyT, float] = dict()
-
-            if grouping_config.cols_to_weighted_average:
-                for _, weight_col_key in grouping_config.cols_to_weighted_average:
-                    sum_by_col[weight_col_key] = 0
-
-                # Calculate the weights
-                for col in sum_by_col.keys():
-                    for _, _, original_s_name in labels_s_names:
-                        val = data_by_sample[original_s_name][col]
-                        if isinstance(val, int) or isinstance(val, float):
-                            sum_by_col[col] += float(val)
+            cols_to_weighted_average = grouping_config.cols_to_weighted_average or []
+            cols_to_average = grouping_config.cols_to_average or []
+            cols_to_sum = grouping_config.cols_to_sum or []
+
+            # Collect every column needed by the aggregations below, preserving order
+            col_idx: Dict[ColumnKeyT, int] = {}
+            for col, weight_col in cols_to_weighted_average:
+                col_idx.setdefault(col, len(col_idx))
+                col_idx.setdefault(weight_col, len(col_idx))
+            for col in itertools.chain(cols_to_average, cols_to_sum):
+                col_idx.setdefault(col, len(col_idx))
+
+            if col_idx:
+                # Coerce the values into one (samples × columns) float matrix, with NaN for
+                # non-numeric cells, so every aggregation is a single C-level reduction
+                matrix = np.array(
+                    [
+                        [_as_float(row[col]) for col in col_idx]
+                        for row in (data_by_sample[original_s_name] for _, _, original_s_name in labels_s_names)
+                    ],
+                    dtype=float,
+                )
+                col_sums = np.nansum(matrix, axis=0)
 
-                for col, weight_col in grouping_config.cols_to_weighted_average:
-                    weight = sum_by_col[weight_col]
+                for col, weight_col in cols_to_weighted_average:
+                    weight = col_sums[col_idx[weight_col]]
                     if weight > 0:
-                        merged_row.data[col] = (
-                            sum(
-                                [
-                                    float(data_by_sample[original_s_name][col])
-                                    * float(data_by_sample[original_s_name][weight_col])
-                                    if (
-                                        isinstance(data_by_sample[original_s_name][col], float)
-                                        or isinstance(data_by_sample[original_s_name][col], int)
-                                    )
-                                    and (
-                                        isinstance(data_by_sample[original_s_name][weight_col], float)
-                                        or isinstance(data_by_sample[original_s_name][weight_col], int)
-                                    )
-                                    else 0
-                                    for _, _, original_s_name in labels_s_names
-                                ]
-                            )
-                            / weight
-                        )
+                        # NaN in either factor drops the sample from the numerator
+                        products = matrix[:, col_idx[col]] * matrix[:, col_idx[weight_col]]
+                        merged_row.data[col] = float(np.nansum(products) / weight)
 
-            if grouping_config.cols_to_average:
-                for col in grouping_config.cols_to_average:
-                    merged_row.data[col] = sum(
-                        [
-                            float(data_by_sample[original_s_name][col])
-                            if (
-                                isinstance(data_by_sample[original_s_name][col], float)
-                                or isinstance(data_by_sample[original_s_name][col], int)
-                            )
-                            else 0
-                            for _, _, original_s_name in labels_s_names
-                        ]
-                    ) / len(labels_s_names)
-
-            if grouping_config.cols_to_sum:
-                for col in grouping_config.cols_to_sum:
-                    if col in sum_by_col:
-                        merged_row.data[col] = sum_by_col[col]
-                    else:
-                        merged_row.data[col] = sum(
-                            [
-                                float(data_by_sample[original_s_name][col])
-                                if (
-                                    isinstance(data_by_sample[original_s_name][col], float)
-                                    or isinstance(data_by_sample[original_s_name][col], int)
-                                )
-                                else 0
-                                for _, _, original_s_name in labels_s_names
-                            ]
-                        )
+                for col in cols_to_average:
+                    merged_row.data[col] = float(col_sums[col_idx[col]]) / len(labels_s_names)
+
+                for col in cols_to_sum:
+                    merged_row.data[col] = float(col_sums[col_idx[col]])
 
             # Add count of fail statuses
             if grouping_config.extra_functions:
@@ -643,6 +867,19 @@ class BaseMultiqcModule:
             if len(s_name) == 0:
                 raise ValueError("Empty list of sample names passed to clean_s_name()")
 
+            # If the raw names are all identical, cleaning one of them is enough
+            if len(s_name) == 1 or len(set(s_name)) == 1:
+                return self.clean_s_name(
+                    s_name[0],
+                    f=f,
+                    root=root,
+                    filename=filename,
+                    search_pattern_key=search_pattern_key,
+                    fn_clean_exts=fn_clean_exts,
+                    fn_clean_trim=fn_clean_trim,
+                    prepend_dirs=prepend_dirs,
+                )
+
             # Extract a sample name from a list of file names (for example, FASTQ pairs).
             # Each name is cleaned separately first:
             clean_names = [
@@ -672,7 +909,10 @@ class BaseMultiqcModule:
             return "_".join(clean_names)
 
         sn = SampleNameMeta(original_name=SampleNameT(s_name))
-        trimmed_name: SampleNameT = sn.original_name
+        # SampleNameT is only a NewType alias, but re-wrapping through SampleNameT(str())
+        # on every rule still pays for the str() calls; work on a plain str and cast once
+        # at the end
+        name: str = s_name
 
         # Backwards compatability - if f is a string, it's probably the root (this used to be the second argument)
         if isinstance(f, str):
@@ -688,6 +928,33 @@ class BaseMultiqcModule:
             if "sp_key" in f and search_pattern_key is None:
                 search_pattern_key = f["sp_key"]
 
+        # Memoize per (name, location) when using the config cleaning rules: aggregator
+        # modules clean the same file names once per submodule. Invalidate if any of the
+        # cleaning-related config values were swapped out under us
+        cache_key: Optional[Tuple] = None
+        if fn_clean_exts is None and fn_clean_trim is None:
+            cache_cfg = (
+                config.fn_clean_exts,
+                config.fn_clean_trim,
+                config.fn_clean_sample_names,
+                config.prepend_dirs,
+                config.prepend_dirs_sep,
+                config.prepend_dirs_depth,
+                config.use_filename_as_sample_name,
+                config.sample_names_replace,
+                config.sample_names_replace_regex,
+                config.sample_names_replace_exact,
+                config.sample_names_replace_complete,
+            )
+            cached_cfg = self._clean_names_cache_cfg
+            if cached_cfg is None or any(a is not b for a, b in zip(cache_cfg, cached_cfg)):
+                self._clean_names_cache = {}
+                self._clean_names_cache_cfg = cache_cfg
+            cache_key = (s_name, root, filename, search_pattern_key, prepend_dirs)
+            cached_name = self._clean_names_cache.get(cache_key)
+            if cached_name is not None:
+                return cached_name
+
         # For modules setting s_name from file contents, set s_name back to the filename
         # (if wanted in the config)
         if filename is not None and (
@@ -698,11 +965,11 @@ class BaseMultiqcModule:
                 and search_pattern_key in config.use_filename_as_sample_name
             )
         ):
-            trimmed_name = SampleNameT(filename)
+            name = filename
 
         # if s_name comes from file contents, it may have a file path
         # For consistency with other modules, we keep just the basename
-        trimmed_name = SampleNameT(os.path.basename(trimmed_name))
+        name = os.path.basename(name)
 
         if fn_clean_exts is None:
             fn_clean_exts = config.fn_clean_exts
@@ -714,7 +981,10 @@ class BaseMultiqcModule:
         # Prepend sample name with directory
         if prepend_dirs:
             sep = config.prepend_dirs_sep
-            dirs = [d.strip() for d in (Path(root).parts if root else []) if d.strip() != ""]
+            dirs = self._dirs_cache.get(root or "")
+            if dirs is None:
+                dirs = tuple(d.strip() for d in (Path(root).parts if root else []) if d.strip() != "")
+                self._dirs_cache[root or ""] = dirs
             if config.prepend_dirs_depth != 0:
                 d_idx = config.prepend_dirs_depth * -1
                 if config.prepend_dirs_depth > 0:
@@ -722,88 +992,83 @@ class BaseMultiqcModule:
                 else:
                     dirs = dirs[:d_idx]
             if len(dirs) > 0:
-                trimmed_name = SampleNameT(f"{sep.join(dirs)}{sep}{trimmed_name}")
+                name = f"{sep.join(dirs)}{sep}{name}"
 
         if config.fn_clean_sample_names:
             # Split then take first section to remove everything after these matches
-            _ext: Union[str, Dict[str, Union[str, List[str]]]]
-            ext: Dict[str, Union[str, List[str]]]
-            for _ext in fn_clean_exts:
-                # Go through different filter types
-                if isinstance(_ext, str):
-                    ext = {"type": "truncate", "pattern": _ext}
-                else:
-                    ext = _ext
-
+            for ext_type, pattern, module_filter in _get_clean_rules(fn_clean_exts):
                 # Check if this config is limited to a module
-                if "module" in ext:
-                    if isinstance(ext["module"], str):
-                        ext["module"] = [ext["module"]]
-                    if not any([m == self.anchor for m in ext["module"]]):
-                        continue
+                if module_filter is not None and self.anchor not in module_filter:
+                    continue
 
-                pattern = ext.get("pattern", "")
-                assert isinstance(pattern, str)
-                if ext.get("type") == "truncate":
-                    trimmed_name = SampleNameT(str(trimmed_name).split(pattern, 1)[0])
-                elif ext.get("type") in ("remove", "replace"):
-                    if ext["type"] == "replace":
-                        logger.warning(
-                            "use 'config.fn_clean_sample_names.remove' instead "
-                            "of 'config.fn_clean_sample_names.replace' [deprecated]"
-                        )
-                    trimmed_name = SampleNameT(str(trimmed_name).replace(pattern, ""))
-                elif ext.get("type") == "regex":
-                    trimmed_name = SampleNameT(re.sub(pattern, "", str(trimmed_name)))
-                elif ext.get("type") == "regex_keep":
-                    match = re.search(pattern, str(trimmed_name))
-                    trimmed_name = SampleNameT(match.group()) if match else trimmed_name
-                elif ext.get("type") is None:
-                    logger.error(f'config.fn_clean_exts config was missing "type" key: {ext}')
-                else:
-                    logger.error(f"Unrecognised sample name cleaning pattern: {ext.get('type')}")
-            # Trim off characters at the end of names
-            for characters in fn_clean_trim:
-                if trimmed_name.endswith(characters):
-                    trimmed_name = SampleNameT(str(trimmed_name)[: -len(characters)])
-                if trimmed_name.startswith(characters):
-                    trimmed_name = SampleNameT(str(trimmed_name)[len(characters) :])
+                if ext_type == "truncate":
+                    name = name.partition(pattern)[0]
+                elif ext_type == "translate":
+                    name = name.translate(pattern)
+                elif ext_type in ("remove", "replace"):
+                    name = name.replace(pattern, "")
+                elif ext_type == "regex":
+                    name = pattern.sub("", name)
+                elif ext_type == "regex_keep":
+                    match = pattern.search(name)
+                    if match:
+                        name = match.group()
+            # Trim off characters at the end of names. The tuple forms of endswith and
+            # startswith test all patterns in one C-level call, so the common case of
+            # nothing to trim skips the per-pattern Python loop entirely
+            trim_tuple = tuple(fn_clean_trim)
+            if trim_tuple and (name.endswith(trim_tuple) or name.startswith(trim_tuple)):
+                for characters in fn_clean_trim:
+                    if name.endswith(characters):
+                        name = name[: -len(characters)]
+                    if name.startswith(characters):
+                        name = name[len(characters) :]
 
         # Remove trailing whitespace
-        trimmed_name = SampleNameT(str(trimmed_name).strip())
+        name = name.strip()
 
         # If we cleaned back to an empty string, just use the original value
-        if trimmed_name == "":
-            trimmed_name = sn.original_name
+        if name == "":
+            name = str(sn.original_name)
 
         # Do any hard replacements that are set with --replace-names
         if config.sample_names_replace:
-            for s_name_search, s_name_replace in config.sample_names_replace.items():
+            # Bind the config flags to locals once rather than re-reading the module
+            # attributes on every pattern iteration
+            replace_exact = config.sample_names_replace_exact
+            replace_regex = config.sample_names_replace_regex
+            replace_complete = config.sample_names_replace_complete
+            for s_name_search, s_name_replace, pattern in _get_replace_rules(
+                config.sample_names_replace, replace_regex
+            ):
                 try:
                     # Skip if we're looking for exact matches only
-                    if config.sample_names_replace_exact:
+                    if replace_exact:
                         # Simple strings
-                        if not config.sample_names_replace_regex and str(trimmed_name) != s_name_search:
+                        if pattern is None and name != s_name_search:
                             continue
                         # regexes
-                        if config.sample_names_replace_regex and not re.fullmatch(s_name_search, trimmed_name):
+                        if pattern is not None and not pattern.fullmatch(name):
                             continue
                     # Replace - regex
-                    if config.sample_names_replace_regex:
-                        trimmed_name = SampleNameT(re.sub(s_name_search, s_name_replace, str(trimmed_name)))
+                    if pattern is not None:
+                        name = pattern.sub(s_name_replace, name)
                     # Replace - simple string
                     else:
                         # Complete name swap
-                        if config.sample_names_replace_complete:
-                            if s_name_search in trimmed_name:
-                                trimmed_name = SampleNameT(s_name_replace)
+                        if replace_complete:
+                            if s_name_search in name:
+                                name = s_name_replace
                         # Partial substring replace
                         else:
-                            trimmed_name = SampleNameT(str(trimmed_name).replace(s_name_search, s_name_replace))
+                            name = name.replace(s_name_search, s_name_replace)
                 except re.error as e:
                     logger.error(f"Error with sample name replacement regex: {e}")
 
+        trimmed_name = SampleNameT(name)
         sn.trimmed_name = trimmed_name
+        if cache_key is not None:
+            self._clean_names_cache[cache_key] = trimmed_name
         return trimmed_name
 
     def ignore_samples(self, data, sample_names_ignore=None, sample_names_ignore_re=None):
@@ -825,9 +1090,10 @@ class BaseMultiqcModule:
         """Should a sample name be ignored?"""
         sample_names_ignore = sample_names_ignore or config.sample_names_ignore
         sample_names_ignore_re = sample_names_ignore_re or config.sample_names_ignore_re
-        glob_match = any(fnmatch.fnmatch(s_name, sn) for sn in sample_names_ignore)
-        re_match = any(re.match(sn, s_name) for sn in sample_names_ignore_re)
-        return glob_match or re_match
+        glob_re = _fuse_ignore_globs(tuple(sample_names_ignore))
+        if glob_re is not None and glob_re.match(os.path.normcase(s_name)):
+            return True
+        return any(p.match(s_name) for p in _compile_ignore_regexes(tuple(sample_names_ignore_re)))
 
     def general_stats_addcols(
         self,
@@ -864,7 +1130,11 @@ class BaseMultiqcModule:
                 SampleGroupT(sample): [
                     InputRowT(
                         sample=sample,
-                        data={k: v for k, v in data.items() if isinstance(v, (int, float, str, bool)) or v is None},
+                        data={
+                            k: v
+                            for k, v in data.items()
+                            if v.__class__ in _SCALAR_CELL_TYPES or isinstance(v, (int, float, str, bool))
+                        },
                     )
                 ]
                 for sample, data in data_by_sample.items()
@@ -910,7 +1180,16 @@ class BaseMultiqcModule:
                 s_name = f["s_name"]
             if source is None:
                 source = os.path.abspath(os.path.join(f["root"], f["fn"]))
-            report.data_sources[module][section][s_name] = source
+            # Resolve the nested dict once per (module, section); invalidate the cache
+            # if report.data_sources was swapped out by a report reset
+            if self._data_sources_cache_root is not report.data_sources:
+                self._data_sources_cache_root = report.data_sources
+                self._data_sources_cache = {}
+            inner = self._data_sources_cache.get((module, section))
+            if inner is None:
+                inner = report.data_sources[module][section]
+                self._data_sources_cache[(module, section)] = inner
+            inner[s_name] = source
         except AttributeError:
             logger.warning(f"Tried to add data source for {self.name}, but was missing fields data")
 
@@ -940,13 +1219,20 @@ class BaseMultiqcModule:
         # Otherwise, use raw string is used for version.
         # - https://peps.python.org/pep-0440/
         parsed_version = software_versions.parse_version(version)
-        if (parsed_version, version) in self.versions[software_name]:
+        if (parsed_version, version) in self._versions_seen[software_name]:
             return
+        self._versions_seen[software_name].add((parsed_version, version))
 
-        self.versions[software_name].append((parsed_version, version))
-
-        # Sort version in order newest --> oldest
-        self.versions[software_name] = software_versions.sort_versions(self.versions[software_name])
+        # Keep the list sorted as sort_versions() would leave it (parsed versions in
+        # order, then unparsed ones), but insert in place with bisect instead of
+        # re-sorting the whole list on every registration
+        if parsed_version is not None:
+            sort_key: Tuple = (False, parsed_version, version)
+        else:
+            sort_key = (True, version, version)
+        idx = bisect.bisect(self._version_sort_keys[software_name], sort_key)
+        self._version_sort_keys[software_name].insert(idx, sort_key)
+        self.versions[software_name].insert(idx, (parsed_version, version))
 
         # Update version list for report section.
         group_name = self.name
@@ -960,12 +1246,15 @@ class BaseMultiqcModule:
         if self.mod_cust_config.get("anchor"):
             fn = f"{fn}_{self.mod_cust_config['anchor']}"
 
-        # Generate a unique filename if the file already exists (running module multiple times)
-        i = 1
+        # Generate a unique filename if the file already exists (running module multiple
+        # times). Start probing from the last suffix used for this base name, so repeat
+        # writes don't re-test every earlier suffix
         base_fn = fn
+        i = report.saved_raw_data_name_counts.get(base_fn, 1)
         while fn in report.saved_raw_data:
             fn = f"{base_fn}_{i}"
             i += 1
+        report.saved_raw_data_name_counts[base_fn] = i
 
         if config.preserve_module_raw_data:
             report.saved_raw_data[fn] = data
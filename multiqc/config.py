@@ -99,6 +99,7 @@ prepend_dirs_depth: int
 prepend_dirs_sep: str
 file_list: bool
 require_logs: bool
+parallel_file_read: bool
 version_check_url: str
 
 make_data_dir: bool
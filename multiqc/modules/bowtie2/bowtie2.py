@@ -6,6 +6,32 @@ from multiqc.plots import bargraph
 
 log = logging.getLogger(__name__)
 
+# These patterns run against every line of every log, so compile them once at import
+_RE_BTCMD = re.compile(r"bowtie2 .+ -[1U] ([^\s,]+)")
+_RE_TOTAL_READS = re.compile(r"(\d+) reads; of these:")
+_RE_UNPAIRED_TOTAL = re.compile(r"(\d+) \([\d\.]+%\) were unpaired; of these:")
+_RE_PAIRED_TOTAL = re.compile(r"(\d+) \([\d\.]+%\) were paired; of these:")
+_RE_OVERALL_RATE = re.compile(r"([\d\.]+)% overall alignment rate")
+
+# The indented count lines within a block are mutually exclusive, so each set of
+# patterns is fused into one alternation scanned in a single pass per line, with the
+# count captured by a named group matching the parsed_data key
+_RE_UNPAIRED_STATS = re.compile(
+    r"(?P<unpaired_aligned_none>\d+) \([\d\.]+%\) aligned 0 times"
+    r"|(?P<unpaired_aligned_one>\d+) \([\d\.]+%\) aligned exactly 1 time"
+    r"|(?P<unpaired_aligned_multi>\d+) \([\d\.]+%\) aligned >1 times"
+)
+_RE_PAIRED_STATS = re.compile(
+    r"(?P<paired_aligned_none>\d+) \([\d\.]+%\) aligned concordantly 0 times"
+    r"|(?P<paired_aligned_one>\d+) \([\d\.]+%\) aligned concordantly exactly 1 time"
+    r"|(?P<paired_aligned_multi>\d+) \([\d\.]+%\) aligned concordantly >1 times"
+    r"|(?P<paired_aligned_discord_one>\d+) \([\d\.]+%\) aligned discordantly 1 time"
+    r"|(?P<paired_aligned_discord_multi>\d+) \([\d\.]+%\) aligned discordantly >1 times"
+    r"|(?P<paired_aligned_mate_one>\d+) \([\d\.]+%\) aligned exactly 1 time"
+    r"|(?P<paired_aligned_mate_multi>\d+) \([\d\.]+%\) aligned >1 times"
+    r"|(?P<paired_aligned_mate_none>\d+) \([\d\.]+%\) aligned 0 times"
+)
+
 
 class MultiqcModule(BaseMultiqcModule):
     """
@@ -56,7 +82,7 @@ class MultiqcModule(BaseMultiqcModule):
         self.bowtie2_data = dict()
         self.num_se = 0
         self.num_pe = 0
-        for f in self.find_log_files("bowtie2", filehandles=True):
+        for f in self.find_log_files("bowtie2"):
             self.parse_bowtie2_logs(f)
 
         # Filter to strip out ignored sample names
@@ -132,73 +158,71 @@ class MultiqcModule(BaseMultiqcModule):
             Overall time: 01:34:37
         """
 
-        # Regexes
-        regexes = {
-            "unpaired": {
-                "unpaired_aligned_none": r"(\d+) \([\d\.]+%\) aligned 0 times",
-                "unpaired_aligned_one": r"(\d+) \([\d\.]+%\) aligned exactly 1 time",
-                "unpaired_aligned_multi": r"(\d+) \([\d\.]+%\) aligned >1 times",
-            },
-            "paired": {
-                "paired_aligned_none": r"(\d+) \([\d\.]+%\) aligned concordantly 0 times",
-                "paired_aligned_one": r"(\d+) \([\d\.]+%\) aligned concordantly exactly 1 time",
-                "paired_aligned_multi": r"(\d+) \([\d\.]+%\) aligned concordantly >1 times",
-                "paired_aligned_discord_one": r"(\d+) \([\d\.]+%\) aligned discordantly 1 time",
-                "paired_aligned_discord_multi": r"(\d+) \([\d\.]+%\) aligned discordantly >1 times",
-                "paired_aligned_mate_one": r"(\d+) \([\d\.]+%\) aligned exactly 1 time",
-                "paired_aligned_mate_multi": r"(\d+) \([\d\.]+%\) aligned >1 times",
-                "paired_aligned_mate_none": r"(\d+) \([\d\.]+%\) aligned 0 times",
-            },
-        }
-
-        # Go through log file line by line
+        # Every bowtie2/HISAT2 summary contains this line, so anything without it can be
+        # rejected with a single substring scan before any per-line regex work. Files
+        # from find_log_files() were already matched on this string, so this only costs
+        # on the direct-call path
+        if "reads; of these:" not in f["f"]:
+            return
+
+        # Go through log file line by line. The file contents arrive as one string from
+        # the bulk read in find_log_files(), so walk the lines with an index: the nested
+        # blocks below consume indented lines, and the line that ends a block still has
+        # to be checked by the patterns further down in the same iteration
         s_name = f["s_name"]
         parsed_data = {}
 
-        for line in f["f"]:
+        lines = f["f"].splitlines()
+        n_lines = len(lines)
+        i = 0
+        while i < n_lines:
+            line = lines[i]
+            i += 1
             # Attempt in vain to find original bowtie2 command, logged by another program
-            btcmd = re.search(r"bowtie2 .+ -[1U] ([^\s,]+)", line)
+            btcmd = _RE_BTCMD.search(line)
             if btcmd:
                 s_name = self.clean_s_name(btcmd.group(1), f)
                 log.debug(f"Found a bowtie2 command, updating sample name to '{s_name}'")
 
             # Total reads
-            total = re.search(r"(\d+) reads; of these:", line)
+            total = _RE_TOTAL_READS.search(line)
             if total:
                 parsed_data["total_reads"] = int(total.group(1))
 
             # Single end reads
-            unpaired = re.search(r"(\d+) \([\d\.]+%\) were unpaired; of these:", line)
+            unpaired = _RE_UNPAIRED_TOTAL.search(line)
             if unpaired:
                 parsed_data["unpaired_total"] = int(unpaired.group(1))
                 self.num_se += 1
 
                 # Do nested loop whilst we have this level of indentation
-                line = f["f"].readline()
-                while line.startswith("    "):
-                    for k, r in regexes["unpaired"].items():
-                        match = re.search(r, line)
-                        if match:
-                            parsed_data[k] = int(match.group(1))
-                    line = f["f"].readline()
+                while i < n_lines and lines[i].startswith("    "):
+                    match = _RE_UNPAIRED_STATS.search(lines[i])
+                    if match:
+                        assert match.lastgroup is not None
+                        parsed_data[match.lastgroup] = int(match.group(match.lastgroup))
+                    i += 1
+                line = lines[i] if i < n_lines else ""
+                i += 1
 
             # Paired end reads
-            paired = re.search(r"(\d+) \([\d\.]+%\) were paired; of these:", line)
+            paired = _RE_PAIRED_TOTAL.search(line)
             if paired:
                 parsed_data["paired_total"] = int(paired.group(1))
                 self.num_pe += 1
 
                 # Do nested loop whilst we have this level of indentation
-                line = f["f"].readline()
-                while line.startswith("    "):
-                    for k, r in regexes["paired"].items():
-                        match = re.search(r, line)
-                        if match:
-                            parsed_data[k] = int(match.group(1))
-                    line = f["f"].readline()
+                while i < n_lines and lines[i].startswith("    "):
+                    match = _RE_PAIRED_STATS.search(lines[i])
+                    if match:
+                        assert match.lastgroup is not None
+                        parsed_data[match.lastgroup] = int(match.group(match.lastgroup))
+                    i += 1
+                line = lines[i] if i < n_lines else ""
+                i += 1
 
             # Overall alignment rate
-            overall = re.search(r"([\d\.]+)% overall alignment rate", line)
+            overall = _RE_OVERALL_RATE.search(line)
             if overall:
                 parsed_data["overall_alignment_rate"] = float(overall.group(1))
 
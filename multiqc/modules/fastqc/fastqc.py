@@ -294,7 +294,7 @@ class MultiqcModule(BaseMultiqcModule):
                         statuses[section] = {s_name: status}
 
         self.intro += '<script type="application/json" class="fastqc_passfails">{}</script>'.format(
-            json.dumps([self.anchor.replace("-", "_"), statuses])
+            json.dumps([self.anchor.replace("-", "_"), statuses], separators=(",", ":"))
         )
         if status_checks:
             self.intro += '<script type="text/javascript">load_fastqc_passfails();</script>'
@@ -761,7 +761,7 @@ class MultiqcModule(BaseMultiqcModule):
         """.format(
             # Generate unique plot ID, needed in mqc_export_selectplots
             id=report.save_htmlid(f"{self.anchor}_per_base_sequence_content_plot"),
-            d=json.dumps([self.anchor.replace("-", "_"), data_by_sample]),
+            d=json.dumps([self.anchor.replace("-", "_"), data_by_sample], separators=(",", ":")),
         )
 
         self.add_section(
@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from multiqc import config
 from multiqc.base_module import BaseMultiqcModule, ModuleNoSamplesFound
@@ -72,13 +73,22 @@ class MultiqcModule(BaseMultiqcModule):
                 "tin",
             ]
 
+        # Import the submodules in parallel: the imports (disk I/O + bytecode compile)
+        # are independent of each other. The parse_reports() calls themselves must stay
+        # sequential in the configured order, as they append report sections and mutate
+        # shared module state
+        with ThreadPoolExecutor(max_workers=min(8, len(rseqc_sections))) as executor:
+            imports = {
+                sm: executor.submit(__import__, f"multiqc.modules.rseqc.{sm}", fromlist=[""]) for sm in rseqc_sections
+            }
+
         # Call submodule functions
         n = dict()
         for sm in rseqc_sections:
             try:
-                # Import the submodule and call parse_reports()
+                # Get the imported submodule and call parse_reports()
                 #   Function returns number of parsed logs
-                module = __import__(f"multiqc.modules.rseqc.{sm}", fromlist=[""])
+                module = imports[sm].result()
                 n[sm] = getattr(module, "parse_reports")(self)
                 if n[sm] > 0:
                     log.info(f"Found {n[sm]} {sm} reports")
@@ -67,6 +67,7 @@ lint_errors: List[str]
 num_flat_plots: int
 some_plots_are_deferred: bool
 saved_raw_data: Dict[str, Dict[SampleNameT, Any]]  # indexed by unique key, then sample name
+saved_raw_data_name_counts: Dict[str, int]  # next suffix to try per base name when deduplicating keys
 last_found_file: Optional[str]
 runtimes: Runtimes
 peak_memory_bytes_per_module: Dict[str, int]
@@ -99,6 +100,7 @@ def reset():
     global num_flat_plots
     global some_plots_are_deferred
     global saved_raw_data
+    global saved_raw_data_name_counts
     global last_found_file
     global runtimes
     global peak_memory_bytes_per_module
@@ -124,6 +126,7 @@ def reset():
     num_flat_plots = 0
     some_plots_are_deferred = False
     saved_raw_data = dict()
+    saved_raw_data_name_counts = dict()
     last_found_file = None
     runtimes = Runtimes()
     peak_memory_bytes_per_module = dict()
@@ -347,7 +350,7 @@ def is_searching_in_source_dir(path: Path) -> bool:
         ".gitignore",
     ]
 
-    filenames = [f.name for f in path.iterdir() if f.is_file()]
+    filenames = [e.name for e in os.scandir(path) if e.is_file()]
 
     if len(filenames) > 0 and all([fn in filenames for fn in multiqc_installation_dir_files]):
         logger.error(f"Error: MultiQC is running in source code directory! {path}")
@@ -411,31 +414,35 @@ def prep_ordered_search_files_list(
     spatterns: List[Dict[ModuleIdT, List[SearchPattern]]] = [{}, {}, {}, {}, {}, {}, {}]
     searchfiles: List[Path] = []
 
-    def _maybe_add_path_to_searchfiles(item: Path):
+    def _maybe_add_path_to_searchfiles(item: Union[Path, "os.DirEntry[str]"]):
         """
         Branching logic to handle analysis paths (directories and files)
-        Walks directory trees recursively calling pathlib's `path.iterdir()`.
+        Walks directory trees recursively with `os.scandir()`: the DirEntry objects it
+        yields reuse the file type information from the directory listing, avoiding an
+        extra stat() call per entry that pathlib's `path.iterdir()` checks would make.
         Guaranteed to work correctly with symlinks even on non-POSIX compliant filesystems.
         """
         if item.is_symlink() and config.ignore_symlinks:
-            file_search_stats["skipped_symlinks"].add(item)
+            file_search_stats["skipped_symlinks"].add(Path(item))
             return
         elif item.is_file():
-            searchfiles.append(item)
+            searchfiles.append(Path(item))
         elif item.is_dir():
+            path = Path(item)
             # Skip directory if it matches ignore patterns
-            d_matches = any(d for d in config.fn_ignore_dirs if item.match(d.rstrip(os.sep)))
-            p_matches = any(p for p in config.fn_ignore_paths if item.match(p.rstrip(os.sep)))
+            d_matches = any(d for d in config.fn_ignore_dirs if path.match(d.rstrip(os.sep)))
+            p_matches = any(p for p in config.fn_ignore_paths if path.match(p.rstrip(os.sep)))
             if d_matches or p_matches:
-                file_search_stats["skipped_directory_fn_ignore_dirs"].add(item)
+                file_search_stats["skipped_directory_fn_ignore_dirs"].add(path)
                 return
 
             # Check not running in install directory
-            if is_searching_in_source_dir(item):
+            if is_searching_in_source_dir(path):
                 return
 
-            for item in item.iterdir():
-                _maybe_add_path_to_searchfiles(item)
+            with os.scandir(path) as it:
+                for entry in it:
+                    _maybe_add_path_to_searchfiles(entry)
 
     ignored_patterns = []
     skipped_patterns = []
@@ -521,6 +528,12 @@ def run_search_files(spatterns: List[Dict[ModuleIdT, List[SearchPattern]]], sear
     runtimes.sp = defaultdict()
     total_sp_starttime = time.time()
 
+    # The ignore patterns are checked for every file, and the result doesn't depend on
+    # their order, so periodically bubble the frequently-matching ones to the front
+    # to cut the average number of fnmatch calls per file
+    ignore_file_pats: List[str] = list(config.fn_ignore_files)
+    ignore_file_pat_hits: Dict[str, int] = {pat: 0 for pat in ignore_file_pats}
+
     def add_file(path: Path):
         """
         Function applied to each file found when walking the analysis
@@ -548,9 +561,13 @@ def run_search_files(spatterns: List[Dict[ModuleIdT, List[SearchPattern]]], sear
 
         # Check if file is in ignore files
         is_ignore_file = False
-        for ignore_pat in config.fn_ignore_files:
+        for ignore_pat in ignore_file_pats:
             if fnmatch.fnmatch(search_f.filename, ignore_pat):
                 is_ignore_file = True
+                hits = ignore_file_pat_hits[ignore_pat] = ignore_file_pat_hits[ignore_pat] + 1
+                if hits % 1024 == 0:
+                    ignore_file_pats.sort(key=lambda pat: -ignore_file_pat_hits[pat])
+                break
 
         # Test file for each search pattern
         file_matched = False
@@ -794,12 +811,22 @@ def clean_htmlid(html_id):
     return html_id_clean
 
 
+# An ID matching this (and not ending with "_") comes out of clean_htmlid() unchanged
+_SAFE_HTMLID_RE = re.compile(r"[a-zA-Z][a-zA-Z0-9_-]*\Z")
+
+
 def save_htmlid(html_id, skiplint=False):
     """Take a HTML ID, sanitise for HTML, check for duplicates and save.
     Returns sanitised, unique ID"""
     global html_ids
     global lint_errors
 
+    # Fast path for the common case: the ID is already sanitized and not a duplicate,
+    # so no cleaning or linting would trigger
+    if _SAFE_HTMLID_RE.match(html_id) and not html_id.endswith("_") and html_id not in html_ids:
+        html_ids.append(html_id)
+        return html_id
+
     # print("html_id:", html_id)
     # import traceback
     #
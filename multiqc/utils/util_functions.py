@@ -136,6 +136,12 @@ def dump_json(data, filehandle=None, **kwargs):
                 return o.model_dump_json()
             return super().default(o)
 
+    # Use compact separators unless a pretty indent was requested: the large dumps
+    # (embedded plot data, data exports) are machine-read, and dropping the whitespace
+    # makes them both smaller and faster to encode
+    if not kwargs.get("indent") and "separators" not in kwargs:
+        kwargs["separators"] = (",", ":")
+
     if filehandle:
         json.dump(replace_nan(data), filehandle, cls=JsonEncoderWithArraySupport, **kwargs)
     else:
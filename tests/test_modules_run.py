@@ -7,6 +7,7 @@ import pytest
 from multiqc import BaseMultiqcModule, config, report, reset, parse_logs
 from multiqc.base_module import ModuleNoSamplesFound
 from multiqc.core.update_config import update_config, ClConfig
+from multiqc.types import AnchorT, ModuleIdT
 
 modules = [(k, entry_point) for k, entry_point in config.avail_modules.items() if k != "custom_content"]
 
@@ -84,6 +85,28 @@ def test_write_data_file(monkeypatch, tmp_path, config_options, expected_to_writ
         assert not expected_path.exists()
 
 
+@pytest.mark.parametrize("parallel_file_read", [False, True])
+def test_parallel_file_read(multiqc_reset, tmp_path, parallel_file_read):
+    """
+    Verify that module.find_log_files() delivers every file with intact contents when
+    `parallel_file_read` is enabled, matching the serial code path regardless of the
+    order the threaded reads complete in
+    """
+    report.reset()
+
+    expected_contents = {f"sample_{i}.log": f"sample_{i}\nsome stats for sample {i}\n" for i in range(20)}
+    for fn, contents in expected_contents.items():
+        (tmp_path / fn).write_text(contents)
+
+    config.parallel_file_read = parallel_file_read
+    report.files = {ModuleIdT("mymodule"): [{"fn": fn, "root": str(tmp_path)} for fn in expected_contents]}
+
+    module = BaseMultiqcModule(name="My module", anchor=AnchorT("mymodule"))
+    found_contents = {f["fn"]: f["f"] for f in module.find_log_files("mymodule")}
+
+    assert found_contents == expected_contents
+
+
 @pytest.mark.parametrize(
     "use_filename_as_sample_name,fn_clean_sample_names,prepend_dirs,expected_sample_name",
     [